@@ -1,11 +1,74 @@
 import os
+import atexit
+import base64
+import errno
 import hashlib
 import boto3 
+from boto3.s3.transfer import S3Transfer, TransferConfig, create_transfer_manager
+from botocore.config import Config as BotoConfig
 import datetime
 import shutil
+import stat
 import mimetypes
+import mmap
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+# Read evidence in 1 MiB chunks so huge disk images never sit fully in memory
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Below this SHA256 speed (bytes/second) we assume there is no hardware acceleration.
+# With SHA-NI / ARMv8 crypto, OpenSSL manages well over 1 GB/s, while plain software
+# implementations are usually around 200-500 MB/s
+SHA256_MIN_THROUGHPUT = 800 * 1000 * 1000
+
+# Local files bigger than this are hashed through mmap instead of read() calls
+MMAP_HASH_THRESHOLD = 128 * 1024 * 1024
+
+# Evidence files copied and hashed at the same time in batch mode
+INGEST_WORKERS = 8
+
+# S3 uploads: files over 8 MiB go up as multipart uploads. All files share one transfer
+# manager, so max_concurrency is the total number of requests (whole small files and
+# parts of big ones) in flight at once across the whole upload
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+_log_lock = threading.Lock()
+_copy_buffers = threading.local()
+# Threads that hash the source while the kernel copies it - one per ingest worker, so every
+# copy in a batch can hash at once. They live for the whole run instead of being started
+# per file; before Python 3.11 (no hashlib.file_digest) each also keeps its read buffer
+_hash_executor = ThreadPoolExecutor(max_workers=INGEST_WORKERS, thread_name_prefix="sha256")
+
+# (source device, destination device) pairs where no kernel copy method works
+_kernel_copy_unsupported = set()
+_log_handles = {}
+
+# Evidence categories and the file extensions that belong to them
+CATEGORY_EXTENSIONS = {
+    'image': ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'),
+    'video': ('.mp4', '.avi', '.mov', '.wmv', '.mkv'),
+    'document': ('.pdf', '.doc', '.docx', '.txt'),
+    'archive': ('.zip', '.rar', '.7z'),
+}
+
+# Flattened once at import into extension -> category for a single dict lookup per file
+FILE_CATEGORIES = {
+    ext: category
+    for category, extensions in CATEGORY_EXTENSIONS.items()
+    for ext in extensions
+}
+
 def collect_case_info():
     """
     Function to collect case information from the user.
@@ -49,11 +112,53 @@ def write_log(logs_dir, message):
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_file = os.path.join(logs_dir, "case_log.txt")
     
-    with open(log_file, "a", encoding='utf-8') as f:
+    # Several evidence files may be processed at once, so only one thread appends at a time
+    with _log_lock:
+        f = _log_handles.get(log_file)
+        if f is None:
+            # Keep the log open for the whole run instead of reopening it for every message
+            f = open(log_file, "a", encoding='utf-8', buffering=1)
+            _log_handles[log_file] = f
+            atexit.register(f.close)
         f.write(f"[{timestamp}] {message}\n")
     
     print(f"📝 LOG: {message}")
 
+@lru_cache(maxsize=512)
+def _guess_mime_type(suffixes):
+    """
+    Look up the MIME type for a file's extensions (cached, since batches repeat the same few extensions).
+    All suffixes are used, not just the last one, so e.g. '.tar.gz' is still seen as a tar archive.
+    """
+    mime_type, _ = mimetypes.guess_type(f"evidence{suffixes}")
+    return mime_type or "unknown"
+
+@dataclass
+class EvidenceRecord:
+    """
+    Everything we know about one processed evidence file.
+    """
+    __slots__ = ('original_path', 'evidence_path', 'hash_path', 'filename', 'original_filename',
+                 'sha256', 'sha256_preview', 'sha256_digest', 'size', 'size_mb', 'created',
+                 'modified', 'mime_type', 'category', 'extension', 'processed_time')
+    
+    original_path: str
+    evidence_path: str
+    hash_path: str
+    filename: str
+    original_filename: str
+    sha256: str
+    sha256_preview: str
+    sha256_digest: bytes
+    size: int
+    size_mb: float
+    created: float
+    modified: float
+    mime_type: str
+    category: str
+    extension: str
+    processed_time: datetime.datetime
+
 def get_file_info(file_path):
     """
     NEW FUNCTION: Get detailed information about a file.
@@ -67,35 +172,264 @@ def get_file_info(file_path):
     # Get file stats
     stats = file_path.stat()
     
-    # Get file type
-    mime_type, _ = mimetypes.guess_type(str(file_path))
-    if not mime_type:
-        mime_type = "unknown"
-    
-    # Determine file category
-    file_category = "unknown"
+    # Get file type and category from the extension
     ext = file_path.suffix.lower()
-    
-    if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']:
-        file_category = "image"
-    elif ext in ['.mp4', '.avi', '.mov', '.wmv', '.mkv']:
-        file_category = "video"
-    elif ext in ['.pdf', '.doc', '.docx', '.txt']:
-        file_category = "document"
-    elif ext in ['.zip', '.rar', '.7z']:
-        file_category = "archive"
+    mime_type = _guess_mime_type("".join(file_path.suffixes).lower())
+    file_category = FILE_CATEGORIES.get(ext, "unknown")
     
     return {
         'filename': file_path.name,
         'size': stats.st_size,
         'size_mb': round(stats.st_size / (1024*1024), 2),
-        'created': datetime.datetime.fromtimestamp(stats.st_ctime),
-        'modified': datetime.datetime.fromtimestamp(stats.st_mtime),
+        # Raw timestamps - only turned into datetimes if something needs to display them
+        'created': stats.st_ctime,
+        'modified': stats.st_mtime,
         'mime_type': mime_type,
         'category': file_category,
         'extension': ext
     }
 
+def check_hash_engine(logs_dir):
+    """
+    Check which SHA256 implementation hashlib is using and how fast it is.
+    The OpenSSL version normally uses the CPU's SHA instructions (SHA-NI on x86,
+    the ARMv8 crypto extensions on ARM). Python's built-in fallback never does, and an
+    OpenSSL build without hardware acceleration is just as slow - the quick 1 MiB
+    timing catches both.
+    """
+    engine = "OpenSSL" if hashlib.sha256.__name__.startswith("openssl_") else "built-in"
+    
+    # Best of a few runs, so one slow run (CPU waking up, another process) doesn't trigger a warning
+    probe = bytes(1 << 20)
+    best_seconds = min(_time_sha256(probe) for _ in range(5))
+    throughput = len(probe) / best_seconds if best_seconds > 0 else float("inf")
+    
+    write_log(logs_dir, f"Hash engine: {engine} SHA256, {throughput / 1e6:.0f} MB/s")
+    
+    if throughput < SHA256_MIN_THROUGHPUT:
+        print(f"⚠️ SHA256 is running at only {throughput / 1e6:.0f} MB/s ({engine}) - "
+              "this Python build doesn't seem to use hardware SHA acceleration, "
+              "so hashing large evidence will be slow.")
+        return False
+    
+    return True
+
+def _time_sha256(data):
+    """
+    Time one SHA256 pass over data, in seconds.
+    """
+    start = time.perf_counter()
+    hashlib.sha256(data)
+    return time.perf_counter() - start
+
+def _get_copy_buffer():
+    """
+    Get this thread's reusable 1 MiB read buffer (and a memoryview of it), so batch
+    ingestion doesn't allocate a fresh buffer for every file.
+    """
+    if not hasattr(_copy_buffers, "buffer"):
+        _copy_buffers.buffer = bytearray(HASH_CHUNK_SIZE)
+        _copy_buffers.view = memoryview(_copy_buffers.buffer)
+    return _copy_buffers.buffer, _copy_buffers.view
+
+def calculate_sha256(file_path, use_mmap=True):
+    """
+    Calculate the SHA256 hash of a file without loading it all into memory.
+    Returns the raw 32-byte digest and the number of bytes that were hashed.
+    Pass use_mmap=False for files on original media (USB drives, network shares): a read
+    error or a file shrinking under an mmap kills the process with SIGBUS instead of raising.
+    """
+    with open(file_path, "rb") as f:
+        if use_mmap and os.fstat(f.fileno()).st_size > MMAP_HASH_THRESHOLD:
+            # Very large evidence (disk images): hash straight out of the page cache
+            hasher = hashlib.sha256()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    for offset in range(0, len(view), HASH_CHUNK_SIZE):
+                        hasher.update(view[offset:offset + HASH_CHUNK_SIZE])
+                    hashed_size = len(view)
+        elif hasattr(hashlib, "file_digest"):
+            hasher = hashlib.file_digest(f, "sha256")
+            hashed_size = f.tell()
+        else:
+            hasher = hashlib.sha256()
+            hashed_size = 0
+            buffer, view = _get_copy_buffer()
+            while True:
+                bytes_read = f.readinto(buffer)
+                if not bytes_read:
+                    break
+                hasher.update(view[:bytes_read])
+                hashed_size += bytes_read
+    
+    return hasher.digest(), hashed_size
+
+class _KernelCopyUnsupported(Exception):
+    """
+    Raised when a kernel copy method can't be used for a file before any data was copied.
+    """
+
+def _check_kernel_copy_progress(copied, offset, size):
+    """
+    A kernel copy call returning 0 before the whole file is copied means it didn't work.
+    At the very start that just means "not supported for this file" (procfs, some FUSE and
+    network filesystems), so fall back. Partway through, the copy would be incomplete, so fail.
+    """
+    if copied == 0:
+        if offset == 0:
+            raise _KernelCopyUnsupported()
+        raise OSError(errno.EIO, f"Kernel copy stopped after {offset} of {size} bytes")
+
+def _check_kernel_copy_error(error, offset):
+    """
+    Decide what an OSError from a kernel copy call means (the same rule shutil uses).
+    If nothing has been copied yet, the method just isn't usable here (EXDEV, ENOSYS,
+    EPERM under container seccomp profiles, ENOTSOCK for sendfile on macOS, ...), so fall back.
+    A full disk, or any error partway through the file, is a real failure.
+    """
+    if offset == 0 and error.errno != errno.ENOSPC:
+        raise _KernelCopyUnsupported() from error
+    raise error
+
+def _copy_file_range_copy(src_fd, dst_fd, size):
+    """
+    Copy size bytes between two open files with os.copy_file_range.
+    """
+    offset = 0
+    while offset < size:
+        try:
+            copied = os.copy_file_range(src_fd, dst_fd, size - offset)
+        except OSError as e:
+            _check_kernel_copy_error(e, offset)
+        _check_kernel_copy_progress(copied, offset, size)
+        offset += copied
+
+def _sendfile_copy(src_fd, dst_fd, size):
+    """
+    Copy size bytes between two open files with os.sendfile.
+    """
+    offset = 0
+    while offset < size:
+        try:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        except OSError as e:
+            _check_kernel_copy_error(e, offset)
+        _check_kernel_copy_progress(sent, offset, size)
+        offset += sent
+
+def _fast_copy(source_path, dest_path, same_filesystem):
+    """
+    Try to copy a file inside the kernel so the data never passes through Python.
+    os.copy_file_range is tried first (a cheap reflink on copy-on-write filesystems),
+    then os.sendfile. Returns False if neither is supported here, or if the source isn't a
+    regular file with a known size (procfs/sysfs files, block devices and some FUSE files
+    report a size of 0, so the size can't be trusted to know when the copy is complete).
+    """
+    use_copy_file_range = hasattr(os, "copy_file_range")
+    use_sendfile = hasattr(os, "sendfile")
+    if not use_copy_file_range and not use_sendfile:
+        return False
+    
+    # copy_file_range only works within one filesystem
+    if not same_filesystem:
+        use_copy_file_range = False
+    
+    with open(source_path, "rb") as src:
+        src_stat = os.fstat(src.fileno())
+        if not stat.S_ISREG(src_stat.st_mode) or src_stat.st_size == 0:
+            return False
+        
+        with open(dest_path, "wb") as dst:
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            size = src_stat.st_size
+            
+            for use, kernel_copy in ((use_copy_file_range, _copy_file_range_copy),
+                                     (use_sendfile, _sendfile_copy)):
+                if not use:
+                    continue
+                try:
+                    kernel_copy(src_fd, dst_fd, size)
+                    return True
+                except _KernelCopyUnsupported:
+                    pass
+                
+                # Throw away anything a failed attempt wrote before trying the next method
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+    
+    return False
+
+def _buffered_copy(source_path, dest_path, hasher=None):
+    """
+    Copy a file through a reusable 1 MiB buffer, feeding each chunk to hasher if given.
+    """
+    buffer, view = _get_copy_buffer()
+    
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        while True:
+            bytes_read = src.readinto(buffer)
+            if not bytes_read:
+                break
+            chunk = view[:bytes_read]
+            dst.write(chunk)
+            if hasher is not None:
+                hasher.update(chunk)
+
+def copy_and_hash(source_path, dest_path):
+    """
+    Copy a file and calculate its SHA256 hash (returned as the raw digest bytes).
+    Where the kernel can copy the file itself, the source is hashed on a second thread
+    while the copy runs, so the total time is the slower of the two rather than both added up.
+    Otherwise every chunk read from the source is written out and hashed in a single pass.
+    
+    With the kernel copy the hash comes from a separate read of the source, so the copy is
+    checked to be exactly as long as what was hashed. A source file whose contents change
+    (without changing size) while it is being copied can't be detected that way - evidence
+    should not be in use while it is ingested.
+    """
+    source_stat = os.stat(source_path)
+    devices = (source_stat.st_dev, os.stat(os.path.dirname(dest_path)).st_dev)
+    
+    # Only regular, non-empty files can be copied by the kernel (see _fast_copy)
+    kernel_copy_available = ((hasattr(os, "copy_file_range") or hasattr(os, "sendfile"))
+                             and stat.S_ISREG(source_stat.st_mode) and source_stat.st_size > 0)
+    
+    if kernel_copy_available and devices not in _kernel_copy_unsupported:
+        hash_future = _hash_executor.submit(calculate_sha256, source_path, use_mmap=False)
+        try:
+            if _fast_copy(source_path, dest_path, same_filesystem=devices[0] == devices[1]):
+                sha256_digest, hashed_size = hash_future.result()
+                copied_size = os.stat(dest_path).st_size
+                if copied_size != hashed_size:
+                    raise OSError(errno.EIO, f"Evidence copy is {copied_size} bytes but {hashed_size} bytes "
+                                             f"were hashed - the source may have changed during the copy")
+            else:
+                # The kernel can't copy between these filesystems (e.g. sendfile on macOS).
+                # Remember that so later files use the single-pass loop instead of reading twice,
+                # and hash what is actually written for this one
+                _kernel_copy_unsupported.add(devices)
+                hasher = hashlib.sha256()
+                _buffered_copy(source_path, dest_path, hasher)
+                sha256_digest = hasher.digest()
+                if hash_future.result()[0] != sha256_digest:
+                    raise OSError(errno.EIO, "Source file changed while it was being copied")
+        finally:
+            # If the copy failed, don't leave the source being read in the background
+            hash_future.cancel()
+            wait([hash_future])
+    else:
+        hasher = hashlib.sha256()
+        _buffered_copy(source_path, dest_path, hasher)
+        sha256_digest = hasher.digest()
+    
+    # Preserve timestamps and permissions like shutil.copy2 did
+    shutil.copystat(source_path, dest_path)
+    
+    return sha256_digest
+
 def process_real_evidence_file(source_path, evidence_dir, hashes_dir, logs_dir):
     """
     NEW FUNCTION: Process a real evidence file - copy it, hash it, log it.
@@ -118,25 +452,26 @@ def process_real_evidence_file(source_path, evidence_dir, hashes_dir, logs_dir):
         write_log(logs_dir, f"ERROR: {error_msg}")
         return None
     
-    # Create unique filename to avoid conflicts
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Create unique filename to avoid conflicts (one timestamp for the whole operation)
+    processed_time = datetime.datetime.now()
+    timestamp = processed_time.strftime("%Y%m%d_%H%M%S")
     safe_filename = f"{timestamp}_{file_info['filename']}"
     dest_path = Path(evidence_dir) / safe_filename
     
     try:
-        # Copy file to evidence directory
-        print(f"📂 Copying file to evidence folder...")
-        shutil.copy2(source_path, dest_path)
+        # Copy file to evidence directory and hash it in the same pass
+        print(f"📂 Copying file to evidence folder and calculating SHA256 hash...")
+        sha256_digest = copy_and_hash(source_path, dest_path)
         write_log(logs_dir, f"File copied: {source_path} -> {dest_path}")
         
-        # Calculate hash
-        print(f"🔒 Calculating SHA256 hash...")
-        with open(dest_path, "rb") as f:
-            file_contents = f.read()
-            sha256_hash = hashlib.sha256(file_contents).hexdigest()
+        # Hex form for files, logs and reports, plus a short preview for console output
+        sha256_hash = sha256_digest.hex()
+        sha256_preview = sha256_hash[:16]
         
         # Save hash file
-        hash_filename = f"{dest_path.stem}.sha256"
+        # Named from the full evidence filename (extension included) - files processed in the
+        # same second share a timestamp, so photo.jpg and photo.png must not share a hash file
+        hash_filename = f"{dest_path.name}.sha256"
         hash_path = Path(hashes_dir) / hash_filename
         
         with open(hash_path, "w") as f:
@@ -145,21 +480,29 @@ def process_real_evidence_file(source_path, evidence_dir, hashes_dir, logs_dir):
         write_log(logs_dir, f"Hash calculated for {safe_filename}: {sha256_hash}")
         
         # Create evidence record
-        evidence_record = {
-            'original_path': str(source_path),
-            'evidence_path': str(dest_path),
-            'hash_path': str(hash_path),
-            'filename': safe_filename,
-            'original_filename': file_info['filename'],
-            'sha256': sha256_hash,
-            'file_info': file_info,
-            'processed_time': datetime.datetime.now()
-        }
+        evidence_record = EvidenceRecord(
+            original_path=str(source_path),
+            evidence_path=str(dest_path),
+            hash_path=str(hash_path),
+            filename=safe_filename,
+            original_filename=file_info['filename'],
+            sha256=sha256_hash,
+            sha256_preview=sha256_preview,
+            sha256_digest=sha256_digest,
+            size=file_info['size'],
+            size_mb=file_info['size_mb'],
+            created=file_info['created'],
+            modified=file_info['modified'],
+            mime_type=file_info['mime_type'],
+            category=file_info['category'],
+            extension=file_info['extension'],
+            processed_time=processed_time
+        )
         
         print(f"✅ Evidence processed: {safe_filename}")
         print(f"   Size: {file_info['size_mb']} MB")
         print(f"   Type: {file_info['category']} ({file_info['mime_type']})")
-        print(f"   Hash: {sha256_hash[:16]}...")
+        print(f"   Hash: {sha256_preview}...")
         
         return evidence_record
         
@@ -169,6 +512,28 @@ def process_real_evidence_file(source_path, evidence_dir, hashes_dir, logs_dir):
         print(f"❌ {error_msg}")
         return None
 
+def process_evidence_batch(file_paths, evidence_dir, hashes_dir, logs_dir):
+    """
+    Process many evidence files at once using a pool of worker threads.
+    Copying and hashing spend most of their time waiting on disk, so several
+    files can be in flight together. Records are returned in the original order.
+    """
+    if not file_paths:
+        return []
+    
+    print(f"\n⚡ Processing {len(file_paths)} evidence files in parallel...")
+    
+    results = [None] * len(file_paths)
+    with ThreadPoolExecutor(max_workers=min(INGEST_WORKERS, len(file_paths))) as executor:
+        futures = {
+            executor.submit(process_real_evidence_file, file_path, evidence_dir, hashes_dir, logs_dir): index
+            for index, file_path in enumerate(file_paths)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    return [record for record in results if record]
+
 def collect_evidence_files(evidence_dir, hashes_dir, logs_dir):
     """
     NEW FUNCTION: Let user add multiple real evidence files.
@@ -195,7 +560,7 @@ def collect_evidence_files(evidence_dir, hashes_dir, logs_dir):
     while True:
         print(f"\nEvidence files added so far: {len(evidence_files)}")
         
-        choice = input("\nOptions:\n1. Add evidence file\n2. Done adding files\nChoice (1/2): ").strip()
+        choice = input("\nOptions:\n1. Add evidence file\n2. Done adding files\n3. Add all files in a folder\nChoice (1/2/3): ").strip()
         
         if choice == "2":
             break
@@ -212,8 +577,22 @@ def collect_evidence_files(evidence_dir, hashes_dir, logs_dir):
                     print(f"🎉 Total evidence files: {len(evidence_files)}")
                 else:
                     print("⚠️ File could not be processed. Please try again.")
+        elif choice == "3":
+            folder_path = input("Enter full path to evidence folder: ").strip()
+            
+            if folder_path:
+                folder_path = folder_path.strip('"').strip("'")
+                
+                if not os.path.isdir(folder_path):
+                    print(f"⚠️ Folder not found: {folder_path}")
+                    continue
+                
+                file_paths = sorted(entry.path for entry in os.scandir(folder_path) if entry.is_file())
+                batch_records = process_evidence_batch(file_paths, evidence_dir, hashes_dir, logs_dir)
+                evidence_files.extend(batch_records)
+                print(f"🎉 Added {len(batch_records)}/{len(file_paths)} files from folder. Total evidence files: {len(evidence_files)}")
         else:
-            print("Please enter 1 or 2")
+            print("Please enter 1, 2 or 3")
     
     write_log(logs_dir, f"Evidence collection completed. Total files: {len(evidence_files)}")
     return evidence_files
@@ -234,6 +613,19 @@ def create_mock_evidence(evidence_dir):
     
     return mock_file
 
+def summarize_evidence(evidence_files):
+    """
+    Work out the total size and the number of files of each type in one pass.
+    Returns (total_size_mb, type_counts).
+    """
+    total_size_mb = 0
+    type_counts = Counter()
+    for ef in evidence_files:
+        total_size_mb += ef.size_mb
+        type_counts[ef.category] += 1
+    
+    return total_size_mb, type_counts
+
 def generate_evidence_summary(evidence_files, case_info, logs_dir):
     """
     NEW FUNCTION: Generate a summary of all evidence files.
@@ -246,7 +638,7 @@ def generate_evidence_summary(evidence_files, case_info, logs_dir):
     print("=" * 40)
     
     total_files = len(evidence_files)
-    total_size_mb = sum(ef['file_info']['size_mb'] for ef in evidence_files)
+    total_size_mb, type_counts = summarize_evidence(evidence_files)
     
     print(f"Case Number: {case_info[0]}")
     print(f"Investigator: {case_info[1]}")
@@ -255,26 +647,47 @@ def generate_evidence_summary(evidence_files, case_info, logs_dir):
     print("")
     
     # File breakdown by type
-    type_counts = {}
-    for ef in evidence_files:
-        file_type = ef['file_info']['category']
-        type_counts[file_type] = type_counts.get(file_type, 0) + 1
-    
     print("Files by Type:")
     for file_type, count in type_counts.items():
         print(f"  {file_type.title()}: {count}")
     
     print("\nEvidence Files:")
     for i, ef in enumerate(evidence_files, 1):
-        print(f"  {i}. {ef['original_filename']}")
-        print(f"     Size: {ef['file_info']['size_mb']} MB")
-        print(f"     Type: {ef['file_info']['category']}")
-        print(f"     Hash: {ef['sha256'][:16]}...")
+        print(f"  {i}. {ef.original_filename}")
+        print(f"     Size: {ef.size_mb} MB")
+        print(f"     Type: {ef.category}")
+        print(f"     Hash: {ef.sha256_preview}...")
         print("")
     
     # Log the summary
     write_log(logs_dir, f"Evidence summary: {total_files} files, {total_size_mb:.2f} MB total")
 
+def _upload_evidence_file(manager, bucket, case, ef):
+    """
+    Queue the upload of one evidence file and its hash file on the shared transfer manager.
+    Returns the transfer futures for both files.
+    """
+    # Have S3 verify the upload against the SHA256 we already calculated during intake.
+    # Multipart uploads are checksummed per part, so those only request SHA256 part checksums.
+    extra_args = {"ChecksumAlgorithm": "SHA256"}
+    if ef.size < S3_TRANSFER_CONFIG.multipart_threshold:
+        extra_args["ChecksumSHA256"] = base64.b64encode(ef.sha256_digest).decode("ascii")
+    
+    # Older boto3/s3transfer releases reject checksum arguments they don't know yet,
+    # so only send the ones this installation supports
+    extra_args = {key: value for key, value in extra_args.items()
+                  if key in S3Transfer.ALLOWED_UPLOAD_ARGS}
+    
+    # Upload evidence file
+    evidence_s3_key = f"case_{case}/evidence/{ef.filename}"
+    evidence_future = manager.upload(ef.evidence_path, bucket, evidence_s3_key, extra_args=extra_args)
+    
+    # Upload hash file
+    hash_s3_key = f"case_{case}/hashes/{Path(ef.hash_path).name}"
+    hash_future = manager.upload(ef.hash_path, bucket, hash_s3_key)
+    
+    return evidence_future, hash_future
+
 def upload_all_to_s3(evidence_files, case):
     """
     Upload all evidence files and hashes to S3.
@@ -286,39 +699,40 @@ def upload_all_to_s3(evidence_files, case):
     print(f"\n☁️ Uploading {len(evidence_files)} evidence files to AWS S3...")
     
     try:
-        # Get AWS credentials
-        aws_access_key = input("Enter your AWS Access Key ID: ").strip()
-        aws_secret_key = input("Enter your AWS Secret Access Key: ").strip()
-        
-        if not aws_access_key or not aws_secret_key:
-            print("❌ AWS credentials required. Skipping S3 upload.")
+        # Use the standard AWS credential chain (env vars, ~/.aws profile, SSO, IAM role)
+        # so uploads never stop to prompt for keys. AWS_REGION wins when set; otherwise the
+        # region comes from AWS_DEFAULT_REGION or the profile like any other AWS tool
+        session = boto3.session.Session(region_name=os.environ.get("AWS_REGION"))
+        if session.get_credentials() is None:
+            print("❌ No AWS credentials found. Run 'aws configure' or set AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY. Skipping S3 upload.")
             return False
         
-        # Create S3 client
-        s3 = boto3.client("s3", 
-                          aws_access_key_id=aws_access_key,
-                          aws_secret_access_key=aws_secret_key,
-                          region_name="us-east-1")
+        # Create S3 client with one pooled connection per request the transfer manager can run
+        s3 = session.client("s3", config=BotoConfig(
+            max_pool_connections=S3_TRANSFER_CONFIG.max_concurrency))
         
         bucket = "mocklab1-evidence-store"
         
-        # Upload each evidence file and its hash
+        # Queue every evidence file (and its hash) on one shared transfer manager - it runs
+        # the uploads concurrently - then wait for each file to report its result
         uploaded = 0
-        for ef in evidence_files:
-            try:
-                # Upload evidence file
-                evidence_s3_key = f"case_{case}/evidence/{ef['filename']}"
-                s3.upload_file(ef['evidence_path'], bucket, evidence_s3_key)
-                
-                # Upload hash file
-                hash_s3_key = f"case_{case}/hashes/{Path(ef['hash_path']).name}"
-                s3.upload_file(ef['hash_path'], bucket, hash_s3_key)
-                
-                uploaded += 1
-                print(f"✅ Uploaded: {ef['filename']}")
-                
-            except Exception as e:
-                print(f"❌ Failed to upload {ef['filename']}: {e}")
+        with create_transfer_manager(s3, S3_TRANSFER_CONFIG) as manager:
+            pending = []
+            for ef in evidence_files:
+                try:
+                    pending.append((ef, _upload_evidence_file(manager, bucket, case, ef)))
+                except Exception as e:
+                    print(f"❌ Failed to upload {ef.filename}: {e}")
+            
+            for ef, futures in pending:
+                try:
+                    for future in futures:
+                        future.result()
+                    uploaded += 1
+                    print(f"✅ Uploaded: {ef.filename}")
+                    
+                except Exception as e:
+                    print(f"❌ Failed to upload {ef.filename}: {e}")
         
         print(f"\n🎉 Successfully uploaded {uploaded}/{len(evidence_files)} files to S3!")
         return uploaded > 0
@@ -328,80 +742,43 @@ def upload_all_to_s3(evidence_files, case):
         return False
 
 # PROFESSIONAL REPORTING FUNCTIONS - INTEGRATED
-def generate_professional_report(case_info, evidence_files, base_dir, reports_dir, logs_dir):
-    """
-    GAME CHANGER: Generate a professional forensic report that looks like 
-    it came from $50,000 commercial software!
-    """
-    print(f"\n📊 GENERATING PROFESSIONAL FORENSIC REPORT")
-    print("=" * 50)
-    
-    case_number = case_info[0]
-    timestamp = datetime.datetime.now()
-    
-    # Create report filename
-    report_filename = f"forensic_report_case_{case_number}_{timestamp.strftime('%Y%m%d_%H%M%S')}.html"
-    report_path = os.path.join(reports_dir, report_filename)
-    
-    # Calculate summary statistics
-    total_files = len(evidence_files)
-    total_size_mb = sum(ef['file_info']['size_mb'] for ef in evidence_files) if evidence_files else 0
-    
-    # File type breakdown
-    type_counts = {}
-    if evidence_files:
-        for ef in evidence_files:
-            file_type = ef['file_info']['category']
-            type_counts[file_type] = type_counts.get(file_type, 0) + 1
-    
-    # Generate file type breakdown HTML
-    type_breakdown = ""
-    if type_counts:
-        type_breakdown = "<div style='margin: 20px 0;'><h4>File Type Breakdown:</h4><ul>"
-        for file_type, count in type_counts.items():
-            percentage = (count / sum(type_counts.values())) * 100
-            type_breakdown += f"<li><strong>{file_type.title()}:</strong> {count} files ({percentage:.1f}%)</li>"
-        type_breakdown += "</ul></div>"
-    
-    # Generate evidence table HTML
-    evidence_table = ""
-    if evidence_files:
-        evidence_table = """
-        <table class="evidence-table">
-            <thead>
-                <tr>
-                    <th>#</th>
-                    <th>Original Filename</th>
-                    <th>File Type</th>
-                    <th>Size (MB)</th>
-                    <th>SHA-256 Hash</th>
-                    <th>Processed Time</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for i, ef in enumerate(evidence_files, 1):
-            file_type = ef['file_info']['category']
-            type_class = f"type-{file_type}"
-            
-            evidence_table += f"""
-                <tr>
-                    <td><strong>{i}</strong></td>
-                    <td>{ef['original_filename']}</td>
-                    <td><span class="file-type {type_class}">{file_type}</span></td>
-                    <td>{ef['file_info']['size_mb']:.2f}</td>
-                    <td class="hash">{ef['sha256']}</td>
-                    <td>{ef['processed_time'].strftime('%Y-%m-%d %H:%M:%S')}</td>
-                </tr>
-            """
-        
-        evidence_table += "</tbody></table>"
-    else:
-        evidence_table = "<p>No evidence files were processed for this case.</p>"
 
-    # Generate the complete HTML report
-    html_content = f"""
+# Static stylesheet for the HTML report, shared by every report
+REPORT_CSS = """\
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }
+        .header { background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); color: white; padding: 30px; border-radius: 10px; margin: -30px -30px 30px -30px; text-align: center; }
+        .header h1 { margin: 0; font-size: 2.5em; font-weight: bold; }
+        .header h2 { margin: 10px 0 0 0; font-size: 1.5em; opacity: 0.9; }
+        .section { margin: 30px 0; padding: 20px; border-left: 4px solid #2a5298; background-color: #f8f9fa; }
+        .section h3 { color: #1e3c72; margin-top: 0; font-size: 1.5em; border-bottom: 2px solid #2a5298; padding-bottom: 10px; }
+        .case-info { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0; }
+        .info-item { background: white; padding: 15px; border-radius: 8px; border: 1px solid #ddd; }
+        .info-label { font-weight: bold; color: #1e3c72; text-transform: uppercase; font-size: 0.9em; margin-bottom: 5px; }
+        .info-value { font-size: 1.1em; color: #333; }
+        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+        .stat-card { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; }
+        .stat-number { font-size: 2.5em; font-weight: bold; margin-bottom: 5px; }
+        .stat-label { font-size: 1em; opacity: 0.9; }
+        .evidence-table { width: 100%; border-collapse: collapse; margin: 20px 0; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .evidence-table th { background: #1e3c72; color: white; padding: 15px; text-align: left; font-weight: bold; }
+        .evidence-table td { padding: 12px 15px; border-bottom: 1px solid #eee; }
+        .evidence-table tr:nth-child(even) { background-color: #f8f9fa; }
+        .evidence-table tr:hover { background-color: #e3f2fd; }
+        .file-type { display: inline-block; padding: 4px 12px; border-radius: 20px; font-size: 0.85em; font-weight: bold; text-transform: uppercase; }
+        .type-image { background: #e8f5e8; color: #2e7d32; }
+        .type-video { background: #fff3e0; color: #f57c00; }
+        .type-document { background: #e3f2fd; color: #1976d2; }
+        .type-archive { background: #fce4ec; color: #c2185b; }
+        .type-unknown { background: #f5f5f5; color: #757575; }
+        .hash { font-family: 'Courier New', monospace; font-size: 0.9em; color: #666; word-break: break-all; }
+        .footer { margin-top: 40px; padding: 20px; background: #f8f9fa; border-radius: 8px; text-align: center; color: #666; font-size: 0.9em; }
+        .integrity-badge { display: inline-block; padding: 6px 12px; background: #4caf50; color: white; border-radius: 20px; font-size: 0.8em; font-weight: bold; }
+"""
+
+# Page skeleton for the HTML report. The dynamic values are filled in with str.format,
+# so only those few fields are built per report
+REPORT_HEADER = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -409,54 +786,27 @@ def generate_professional_report(case_info, evidence_files, base_dir, reports_di
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Digital Forensic Report - Case {case_number}</title>
     <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }}
-        .header {{ background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); color: white; padding: 30px; border-radius: 10px; margin: -30px -30px 30px -30px; text-align: center; }}
-        .header h1 {{ margin: 0; font-size: 2.5em; font-weight: bold; }}
-        .header h2 {{ margin: 10px 0 0 0; font-size: 1.5em; opacity: 0.9; }}
-        .section {{ margin: 30px 0; padding: 20px; border-left: 4px solid #2a5298; background-color: #f8f9fa; }}
-        .section h3 {{ color: #1e3c72; margin-top: 0; font-size: 1.5em; border-bottom: 2px solid #2a5298; padding-bottom: 10px; }}
-        .case-info {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0; }}
-        .info-item {{ background: white; padding: 15px; border-radius: 8px; border: 1px solid #ddd; }}
-        .info-label {{ font-weight: bold; color: #1e3c72; text-transform: uppercase; font-size: 0.9em; margin-bottom: 5px; }}
-        .info-value {{ font-size: 1.1em; color: #333; }}
-        .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .stat-card {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; }}
-        .stat-number {{ font-size: 2.5em; font-weight: bold; margin-bottom: 5px; }}
-        .stat-label {{ font-size: 1em; opacity: 0.9; }}
-        .evidence-table {{ width: 100%; border-collapse: collapse; margin: 20px 0; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .evidence-table th {{ background: #1e3c72; color: white; padding: 15px; text-align: left; font-weight: bold; }}
-        .evidence-table td {{ padding: 12px 15px; border-bottom: 1px solid #eee; }}
-        .evidence-table tr:nth-child(even) {{ background-color: #f8f9fa; }}
-        .evidence-table tr:hover {{ background-color: #e3f2fd; }}
-        .file-type {{ display: inline-block; padding: 4px 12px; border-radius: 20px; font-size: 0.85em; font-weight: bold; text-transform: uppercase; }}
-        .type-image {{ background: #e8f5e8; color: #2e7d32; }}
-        .type-video {{ background: #fff3e0; color: #f57c00; }}
-        .type-document {{ background: #e3f2fd; color: #1976d2; }}
-        .type-archive {{ background: #fce4ec; color: #c2185b; }}
-        .type-unknown {{ background: #f5f5f5; color: #757575; }}
-        .hash {{ font-family: 'Courier New', monospace; font-size: 0.9em; color: #666; word-break: break-all; }}
-        .footer {{ margin-top: 40px; padding: 20px; background: #f8f9fa; border-radius: 8px; text-align: center; color: #666; font-size: 0.9em; }}
-        .integrity-badge {{ display: inline-block; padding: 6px 12px; background: #4caf50; color: white; border-radius: 20px; font-size: 0.8em; font-weight: bold; }}
-    </style>
+"""
+
+REPORT_SUMMARY = """    </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>🔬 DIGITAL FORENSIC REPORT</h1>
             <h2>Case #{case_number}</h2>
-            <p>Generated on {timestamp.strftime('%B %d, %Y at %I:%M %p')}</p>
+            <p>Generated on {generated_on}</p>
         </div>
 
         <div class="section">
             <h3>📋 Case Information</h3>
             <div class="case-info">
-                <div class="info-item"><div class="info-label">Case Number</div><div class="info-value">{case_info[0]}</div></div>
-                <div class="info-item"><div class="info-label">Investigator</div><div class="info-value">{case_info[1]}</div></div>
-                <div class="info-item"><div class="info-label">Victim</div><div class="info-value">{case_info[2]}</div></div>
-                <div class="info-item"><div class="info-label">Suspect</div><div class="info-value">{case_info[3]}</div></div>
-                <div class="info-item"><div class="info-label">Crime Type</div><div class="info-value">{case_info[4]}</div></div>
-                <div class="info-item"><div class="info-label">Report Generated</div><div class="info-value">{timestamp.strftime('%Y-%m-%d %H:%M:%S')}</div></div>
+                <div class="info-item"><div class="info-label">Case Number</div><div class="info-value">{case_number}</div></div>
+                <div class="info-item"><div class="info-label">Investigator</div><div class="info-value">{investigator}</div></div>
+                <div class="info-item"><div class="info-label">Victim</div><div class="info-value">{victim}</div></div>
+                <div class="info-item"><div class="info-label">Suspect</div><div class="info-value">{suspect}</div></div>
+                <div class="info-item"><div class="info-label">Crime Type</div><div class="info-value">{crime_type}</div></div>
+                <div class="info-item"><div class="info-label">Report Generated</div><div class="info-value">{generated_at}</div></div>
             </div>
         </div>
 
@@ -465,15 +815,45 @@ def generate_professional_report(case_info, evidence_files, base_dir, reports_di
             <div class="stats-grid">
                 <div class="stat-card"><div class="stat-number">{total_files}</div><div class="stat-label">Evidence Files</div></div>
                 <div class="stat-card"><div class="stat-number">{total_size_mb:.1f}</div><div class="stat-label">Total Size (MB)</div></div>
-                <div class="stat-card"><div class="stat-number">{len(type_counts)}</div><div class="stat-label">File Types</div></div>
+                <div class="stat-card"><div class="stat-number">{type_count}</div><div class="stat-label">File Types</div></div>
                 <div class="stat-card"><div class="stat-number">✓</div><div class="stat-label">Integrity Verified</div></div>
             </div>
-            {type_breakdown}
+            """
+
+REPORT_INVENTORY_START = """
         </div>
 
         <div class="section">
             <h3>📁 Evidence Inventory</h3>
-            {evidence_table}
+            """
+
+REPORT_TABLE_HEADER = """
+        <table class="evidence-table">
+            <thead>
+                <tr>
+                    <th>#</th>
+                    <th>Original Filename</th>
+                    <th>File Type</th>
+                    <th>Size (MB)</th>
+                    <th>SHA-256 Hash</th>
+                    <th>Processed Time</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+REPORT_TABLE_ROW = """
+                <tr>
+                    <td><strong>{index}</strong></td>
+                    <td>{original_filename}</td>
+                    <td><span class="file-type {type_class}">{file_type}</span></td>
+                    <td>{size_mb:.2f}</td>
+                    <td class="hash">{sha256}</td>
+                    <td>{processed_time:%Y-%m-%d %H:%M:%S}</td>
+                </tr>
+            """
+
+REPORT_FOOTER = """
         </div>
 
         <div class="section">
@@ -499,10 +879,83 @@ def generate_professional_report(case_info, evidence_files, base_dir, reports_di
 </body>
 </html>
 """
+
+def _render_report(case_info, evidence_files, base_dir, report_filename, timestamp):
+    """
+    Yield the HTML report piece by piece so it can be streamed straight to disk
+    instead of being built up as one giant string.
+    """
+    case_number = case_info[0]
+    
+    # Calculate summary statistics and file type breakdown
+    total_files = len(evidence_files)
+    total_size_mb, type_counts = summarize_evidence(evidence_files)
+    
+    yield REPORT_HEADER.format(case_number=case_number)
+    yield REPORT_CSS
+    yield REPORT_SUMMARY.format(
+        case_number=case_number,
+        investigator=case_info[1],
+        victim=case_info[2],
+        suspect=case_info[3],
+        crime_type=case_info[4],
+        generated_on=timestamp.strftime('%B %d, %Y at %I:%M %p'),
+        generated_at=timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+        total_files=total_files,
+        total_size_mb=total_size_mb,
+        type_count=len(type_counts),
+    )
+    
+    # File type breakdown HTML
+    if type_counts:
+        total_typed = sum(type_counts.values())
+        yield "<div style='margin: 20px 0;'><h4>File Type Breakdown:</h4><ul>"
+        for file_type, count in type_counts.items():
+            percentage = (count / total_typed) * 100
+            yield f"<li><strong>{file_type.title()}:</strong> {count} files ({percentage:.1f}%)</li>"
+        yield "</ul></div>"
+    
+    yield REPORT_INVENTORY_START
+    
+    # Evidence table HTML, one row at a time
+    if evidence_files:
+        yield REPORT_TABLE_HEADER
+        
+        for i, ef in enumerate(evidence_files, 1):
+            yield REPORT_TABLE_ROW.format(
+                index=i,
+                original_filename=ef.original_filename,
+                type_class=f"type-{ef.category}",
+                file_type=ef.category,
+                size_mb=ef.size_mb,
+                sha256=ef.sha256,
+                processed_time=ef.processed_time,
+            )
+        
+        yield "</tbody></table>"
+    else:
+        yield "<p>No evidence files were processed for this case.</p>"
     
-    # Write the HTML report
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    yield REPORT_FOOTER.format(base_dir=base_dir, report_filename=report_filename)
+
+def generate_professional_report(case_info, evidence_files, base_dir, reports_dir, logs_dir):
+    """
+    GAME CHANGER: Generate a professional forensic report that looks like 
+    it came from $50,000 commercial software!
+    """
+    print(f"\n📊 GENERATING PROFESSIONAL FORENSIC REPORT")
+    print("=" * 50)
+    
+    case_number = case_info[0]
+    timestamp = datetime.datetime.now()
+    
+    # Create report filename
+    report_filename = f"forensic_report_case_{case_number}_{timestamp.strftime('%Y%m%d_%H%M%S')}.html"
+    report_path = os.path.join(reports_dir, report_filename)
+    
+    # Stream the HTML report to disk as it is rendered
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        f.writelines(_render_report(case_info, evidence_files, base_dir, report_filename, timestamp))
     
     print(f"✅ Professional HTML report: {report_filename}")
     print(f"🌐 Open the HTML file in any web browser to view!")
@@ -529,6 +982,7 @@ def main():
         write_log(logs_dir, f"Victim: {case_info[2]}")
         write_log(logs_dir, f"Suspect: {case_info[3]}")
         write_log(logs_dir, f"Crime Type: {case_info[4]}")
+        check_hash_engine(logs_dir)
         
         # Step 4: Collect evidence files (FEATURE 1: Multi-file processing!)
         evidence_files = collect_evidence_files(evidence_dir, hashes_dir, logs_dir)
@@ -540,21 +994,26 @@ def main():
         # Step 5: Generate evidence summary
         generate_evidence_summary(evidence_files, case_info, logs_dir)
         
-        # Step 6: Generate professional report (FEATURE 2: Professional reporting!)
-        print(f"\n🎊 GENERATING PROFESSIONAL FORENSIC REPORT")
-        print("=" * 50)
-        report_path = generate_professional_report(case_info, evidence_files, base_dir, reports_dir, logs_dir)
-        
-        # Step 7: Upload to S3 (optional)
+        # Step 6: Upload to S3 (optional) - runs in the background while the report is generated
         upload_choice = input(f"\nUpload all {len(evidence_files)} files to S3? (y/n): ").lower()
-        if upload_choice.startswith('y'):
-            success = upload_all_to_s3(evidence_files, case)
-            if success:
-                write_log(logs_dir, f"Files uploaded to S3: {len(evidence_files)} files")
+        with ThreadPoolExecutor(max_workers=1) as upload_executor:
+            upload_future = None
+            if upload_choice.startswith('y'):
+                upload_future = upload_executor.submit(upload_all_to_s3, evidence_files, case)
+            
+            # Step 7: Generate professional report (FEATURE 2: Professional reporting!)
+            print(f"\n🎊 GENERATING PROFESSIONAL FORENSIC REPORT")
+            print("=" * 50)
+            report_path = generate_professional_report(case_info, evidence_files, base_dir, reports_dir, logs_dir)
+            
+            if upload_future is not None:
+                success = upload_future.result()
+                if success:
+                    write_log(logs_dir, f"Files uploaded to S3: {len(evidence_files)} files")
+                else:
+                    write_log(logs_dir, "S3 upload failed or incomplete")
             else:
-                write_log(logs_dir, "S3 upload failed or incomplete")
-        else:
-            write_log(logs_dir, "S3 upload skipped by user")
+                write_log(logs_dir, "S3 upload skipped by user")
         
         # Step 8: Final summary with SHOCK VALUE!
         print(f"\n🎉 CASE {case} PROCESSING COMPLETE!")
@@ -563,7 +1022,8 @@ def main():
         print(f"📄 Evidence files processed: {len(evidence_files)}")
         print(f"🔒 Hash files created: {len(evidence_files)}")
         print(f"📝 Log file: {os.path.join(logs_dir, 'case_log.txt')}")
-        print(f"📊 Total evidence size: {sum(ef['file_info']['size_mb'] for ef in evidence_files):.2f} MB")
+        total_size_mb, _ = summarize_evidence(evidence_files)
+        print(f"📊 Total evidence size: {total_size_mb:.2f} MB")
         print(f"📋 Professional report: {os.path.basename(report_path)}")
         print(f"\n💡 TIP: Open the HTML report in your web browser!")
         print(f"💡 TIP: Share the report with colleagues - it looks amazing!")